@@ -5,18 +5,96 @@ This module exposes a `create_app` function that constructs the Flask
 application with all necessary configuration, extensions, and blueprints.
 It configures SQLAlchemy for SQLite, JWT for authentication, and
 Swagger/OpenAPI using Flask-Smorest.
+
+Set `APP_ENV=production` for a faster boot.  Swagger UI is not set up
+and `/openapi.json` serves a spec cached in the instance folder.  The
+cache file name includes `API_VERSION` and a hash of this module and
+the resource and schema sources, so a deploy that changes the API
+builds a fresh spec on its first boot and writes it.  Later boots
+register blueprints with Flask directly, which skips per-route spec
+generation.
+
+Set `STARTUP_PROFILE=1` to log how long each import and blueprint
+registration took; the numbers are always available in
+`app.extensions["startup_timings"]`.
 """
 
-from flask import Flask
+import hashlib
+import importlib
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+from flask import Flask, send_file
 from flask_smorest import Api
 from flask_jwt_extended import JWTManager
 
 from db import db
 
 
-def create_app() -> Flask:
+# Sources that determine the OpenAPI spec: this module holds the spec
+# config, the packages hold the routes and schemas
+SPEC_SOURCE_FILES = ("app.py",)
+SPEC_SOURCE_PACKAGES = ("resources", "schemas")
+
+# Blueprint modules, imported by name so each import can be timed
+BLUEPRINT_MODULES = (
+    "resources.auth",
+    "resources.pets",
+    "resources.services",
+    "resources.reservations",
+    "resources.waitlist",
+)
+
+
+@contextmanager
+def _timed(timings, label):
+    """Record the wall time spent in the block under `label` (ms)."""
+    started = time.perf_counter()
+    yield
+    timings[label] = (time.perf_counter() - started) * 1000
+
+
+def _spec_cache_path(app):
+    """Return the spec cache file for this API version and source tree."""
+    paths = list(SPEC_SOURCE_FILES)
+    for package in SPEC_SOURCE_PACKAGES:
+        directory = os.path.join(app.root_path, package)
+        paths.extend(
+            os.path.join(package, name)
+            for name in sorted(os.listdir(directory)) if name.endswith(".py")
+        )
+
+    digest = hashlib.sha256(app.config["API_VERSION"].encode())
+    for path in paths:
+        digest.update(path.encode())
+        with open(os.path.join(app.root_path, path), "rb") as f:
+            digest.update(f.read())
+    return os.path.join(
+        app.instance_path,
+        f"openapi-{app.config['API_VERSION']}-{digest.hexdigest()[:12]}.json",
+    )
+
+
+def _write_spec_cache(api, path):
+    """Write the generated OpenAPI spec to `path` atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(api.spec.to_dict(), f)
+    os.replace(tmp_path, path)
+
+
+def create_app(production=None) -> Flask:
     """Application factory function."""
+    timings = {}
+    started = time.perf_counter()
+
     app = Flask(__name__)
+    if production is None:
+        production = os.environ.get("APP_ENV") == "production"
 
     # Database configuration
     app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///petboarding.db"
@@ -26,30 +104,54 @@ def create_app() -> Flask:
     app.config["API_TITLE"] = "Pet Boarding REST API"
     app.config["API_VERSION"] = "v1"
     app.config["OPENAPI_VERSION"] = "3.0.3"
-    app.config["OPENAPI_URL_PREFIX"] = "/"
-    app.config["OPENAPI_SWAGGER_UI_PATH"] = "/swagger-ui"
-    app.config["OPENAPI_SWAGGER_UI_URL"] = (
-        "https://cdn.jsdelivr.net/npm/swagger-ui-dist/"
-    )
+    if not production:
+        app.config["OPENAPI_URL_PREFIX"] = "/"
+        app.config["OPENAPI_SWAGGER_UI_PATH"] = "/swagger-ui"
+        app.config["OPENAPI_SWAGGER_UI_URL"] = (
+            "https://cdn.jsdelivr.net/npm/swagger-ui-dist/"
+        )
+
+    spec_cache = None
+    if production:
+        with _timed(timings, "spec cache key"):
+            spec_cache = _spec_cache_path(app)
+    use_spec_cache = spec_cache is not None and os.path.exists(spec_cache)
 
     # JWT configuration
     app.config["JWT_SECRET_KEY"] = "super-secret"  # change in production
 
     # Initialize extensions
-    db.init_app(app)
-    api = Api(app)
-    JWTManager(app)
-
-    # Import and register blueprints
-    from resources.auth import blp as AuthBlueprint
-    from resources.pets import blp as PetsBlueprint
-    from resources.services import blp as ServicesBlueprint
-    from resources.reservations import blp as ReservationsBlueprint
-
-    api.register_blueprint(AuthBlueprint)
-    api.register_blueprint(PetsBlueprint)
-    api.register_blueprint(ServicesBlueprint)
-    api.register_blueprint(ReservationsBlueprint)
+    with _timed(timings, "extensions"):
+        db.init_app(app)
+        api = Api(app)
+        JWTManager(app)
+
+    # Import and register blueprints.  With a cached spec they go
+    # straight to Flask, which skips building their OpenAPI paths.
+    for module_name in BLUEPRINT_MODULES:
+        with _timed(timings, f"import {module_name}"):
+            blueprint = importlib.import_module(module_name).blp
+        with _timed(timings, f"register {module_name}"):
+            if use_spec_cache:
+                app.register_blueprint(blueprint)
+            else:
+                api.register_blueprint(blueprint)
+
+    if production:
+        if not use_spec_cache:
+            with _timed(timings, "write spec cache"):
+                _write_spec_cache(api, spec_cache)
+
+        @app.route("/openapi.json")
+        def openapi_json():
+            return send_file(spec_cache, mimetype="application/json")
+
+    timings["total"] = (time.perf_counter() - started) * 1000
+    app.extensions["startup_timings"] = timings
+    if os.environ.get("STARTUP_PROFILE"):
+        app.logger.setLevel(logging.INFO)
+        for label, ms in timings.items():
+            app.logger.info("startup %-35s %8.1f ms", label, ms)
 
     return app
 
@@ -0,0 +1,70 @@
+"""Cold-start benchmark for `create_app`.
+
+Boots the app in fresh interpreter processes, as an autoscaled worker
+would, and reports the median process wall time and `create_app` time
+for the default (development) mode and for production mode with a
+cached OpenAPI spec:
+
+    python benchmarks/cold_start.py --runs 10
+
+Each run also prints the in-process `create_app` breakdown when
+`--profile` is given.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Prints the factory's own timing so it can be reported next to the
+# process wall time, which is dominated by interpreter and library imports
+BOOT = (
+    "from app import create_app; "
+    "print(create_app().extensions['startup_timings']['total'])"
+)
+
+
+def _boot(env):
+    """Boot once; return (process wall time, create_app time) in ms."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", BOOT], cwd=ROOT, env=env, check=True,
+        stdout=subprocess.PIPE, text=True,
+    )
+    wall = (time.perf_counter() - started) * 1000
+    return wall, float(result.stdout.split()[-1])
+
+
+def measure(app_env, runs, profile):
+    env = dict(os.environ, APP_ENV=app_env)
+    if profile:
+        env["STARTUP_PROFILE"] = "1"
+    # Warm-up boot; in production mode this also writes the spec cache
+    _boot(env)
+    return [_boot(env) for _ in range(runs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure app cold-start time.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--profile", action="store_true")
+    args = parser.parse_args()
+
+    for app_env in ("development", "production"):
+        samples = measure(app_env, args.runs, args.profile)
+        wall = [sample[0] for sample in samples]
+        factory = [sample[1] for sample in samples]
+        print(
+            f"{app_env:<12} process median {statistics.median(wall):7.1f} ms "
+            f"(min {min(wall):7.1f})  create_app median "
+            f"{statistics.median(factory):6.1f} ms (min {min(factory):6.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
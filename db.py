@@ -5,9 +5,26 @@ the application. Import `db` from this module in your models to
 initialize table mappings and perform CRUD operations.
 """
 
+from sqlite3 import Connection as SQLite3Connection
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 # Initialize the SQLAlchemy instance.  Note that the application
 # configuration for the database URI must be set in app.py before
 # calling `db.init_app(app)`.
-db = SQLAlchemy()
\ No newline at end of file
+db = SQLAlchemy()
+
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Turn on foreign key enforcement for SQLite connections.
+
+    SQLite ignores `ON DELETE CASCADE` unless this pragma is set on
+    every connection.  Other databases enforce it natively.
+    """
+    if isinstance(dbapi_connection, SQLite3Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
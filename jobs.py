@@ -0,0 +1,189 @@
+"""Durable background job queue.
+
+Request handlers call `enqueue` to record deferred work in the `jobs`
+table using the current session, so the job is committed atomically
+with the reservation, service or pet change that triggered it.  Task
+functions are registered with the `task` decorator (see `tasks.py`)
+and executed by `run_next`, which `worker.py` calls in a loop.
+"""
+
+import traceback
+from datetime import datetime, timedelta
+
+from db import db
+from models.job import JobModel
+
+
+# Retry delays grow as BACKOFF_BASE_SECONDS * 2 ** (attempt - 1), capped
+BACKOFF_BASE_SECONDS = 5
+BACKOFF_MAX_SECONDS = 3600
+
+# A job whose heartbeat (locked_at) is older than this is assumed to
+# belong to a crashed worker and is handed out again
+STALE_AFTER = timedelta(minutes=10)
+
+# Finished jobs are deleted once they are this old; failed jobs are
+# kept for inspection
+KEEP_DONE_FOR = timedelta(days=7)
+
+TASKS = {}
+
+# Id of the job this process is currently running, for `heartbeat`
+_current_job_id = None
+
+
+def task(name):
+    """Register the decorated function as the handler for jobs named `name`."""
+    def decorator(func):
+        TASKS[name] = func
+        return func
+    return decorator
+
+
+def enqueue(name, payload=None, run_at=None, max_attempts=5, unique=False):
+    """Add a job to the current session without committing.
+
+    The caller's own `db.session.commit()` makes the job visible to
+    workers.  With `unique=True` nothing is added when a job for the
+    same task and payload is already pending, which keeps idempotent
+    jobs such as purges from piling up.  Returns the job, or the
+    existing pending one.
+    """
+    payload = payload or {}
+    if unique:
+        for existing in JobModel.query.filter_by(task=name, status="pending"):
+            if existing.payload == payload:
+                return existing
+
+    job = JobModel(
+        task=name,
+        payload=payload,
+        run_at=run_at or datetime.utcnow(),
+        max_attempts=max_attempts,
+    )
+    db.session.add(job)
+    return job
+
+
+def backoff_delay(attempts):
+    """Return the delay before retry number `attempts`."""
+    seconds = BACKOFF_BASE_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, BACKOFF_MAX_SECONDS))
+
+
+def requeue_stale():
+    """Hand jobs whose worker stopped heartbeating back to the queue.
+
+    The lost run counts as an attempt, so a job that keeps crashing its
+    worker ends up "failed" instead of being retried forever.
+    """
+    stale = JobModel.query.filter(
+        JobModel.status == "running",
+        JobModel.locked_at < datetime.utcnow() - STALE_AFTER,
+    )
+    failed = stale.filter(JobModel.attempts + 1 >= JobModel.max_attempts).update(
+        {
+            "status": "failed",
+            "attempts": JobModel.attempts + 1,
+            "locked_at": None,
+            "last_error": "Worker stopped responding",
+        },
+        synchronize_session=False,
+    )
+    requeued = stale.update(
+        {
+            "status": "pending",
+            "attempts": JobModel.attempts + 1,
+            "locked_at": None,
+        },
+        synchronize_session=False,
+    )
+    db.session.commit()
+    return failed + requeued
+
+
+def prune_done():
+    """Delete finished jobs older than KEEP_DONE_FOR."""
+    count = JobModel.query.filter(
+        JobModel.status == "done",
+        JobModel.run_at < datetime.utcnow() - KEEP_DONE_FOR,
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return count
+
+
+def heartbeat():
+    """Refresh the running job's lock so it is not treated as stale.
+
+    Long tasks call this between units of work; the update is committed
+    with the task's own next commit.
+    """
+    if _current_job_id is not None:
+        JobModel.query.filter_by(id=_current_job_id).update(
+            {"locked_at": datetime.utcnow()}, synchronize_session=False
+        )
+
+
+def _claim_next():
+    """Atomically move the oldest due job from pending to running.
+
+    The conditional UPDATE makes the claim safe when several worker
+    processes race for the same row: only one of them sees a rowcount
+    of 1.
+    """
+    while True:
+        now = datetime.utcnow()
+        job = (
+            JobModel.query
+            .filter(JobModel.status == "pending", JobModel.run_at <= now)
+            .order_by(JobModel.run_at, JobModel.id)
+            .first()
+        )
+        if job is None:
+            db.session.rollback()
+            return None
+
+        claimed = JobModel.query.filter_by(id=job.id, status="pending").update(
+            {"status": "running", "locked_at": now}, synchronize_session=False
+        )
+        db.session.commit()
+        if claimed:
+            db.session.refresh(job)
+            return job
+
+
+def run_next():
+    """Claim and run one due job.
+
+    Returns False when the queue had nothing due, True otherwise.  Must
+    be called inside an application context.
+    """
+    job = _claim_next()
+    if job is None:
+        return False
+
+    global _current_job_id
+    _current_job_id = job.id
+    handler = TASKS.get(job.task)
+    try:
+        if handler is None:
+            raise LookupError(f"No task registered under {job.task!r}")
+        handler(**job.payload)
+    except Exception:
+        db.session.rollback()
+        job.attempts += 1
+        job.last_error = traceback.format_exc()
+        job.locked_at = None
+        if job.attempts >= job.max_attempts:
+            job.status = "failed"
+        else:
+            job.status = "pending"
+            job.run_at = datetime.utcnow() + backoff_delay(job.attempts)
+    else:
+        job.attempts += 1
+        job.status = "done"
+        job.locked_at = None
+    finally:
+        _current_job_id = None
+    db.session.commit()
+    return True
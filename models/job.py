@@ -0,0 +1,32 @@
+"""SQLAlchemy model for a queued background job.
+
+Jobs are rows in the application database so they can be written in
+the same transaction as the change that caused them (outbox pattern):
+if the request's commit fails, the job disappears with it.  Workers
+(see `worker.py`) claim pending jobs whose `run_at` has passed, run
+them, and reschedule failures with exponential backoff.
+"""
+
+from datetime import datetime
+
+from db import db
+
+
+class JobModel(db.Model):
+    __tablename__ = "jobs"
+    __table_args__ = (db.Index("ix_jobs_status_run_at", "status", "run_at"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    task = db.Column(db.String(80), nullable=False)
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+
+    # pending -> running -> done, or back to pending for a retry and
+    # finally failed once max_attempts is exhausted
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=5)
+    last_error = db.Column(db.Text, nullable=True)
+
+    run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
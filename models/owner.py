@@ -19,5 +19,5 @@ class OwnerModel(db.Model):
     # Relationship: one owner can have many pets
     pets = db.relationship(
         "PetModel", back_populates="owner", cascade="all, delete",
-        lazy="dynamic"
+        lazy="dynamic", passive_deletes=True
     )
\ No newline at end of file
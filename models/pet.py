@@ -5,16 +5,17 @@ This model stores basic identifying information about each pet.
 """
 
 from db import db
+from models.soft_delete import SoftDeleteMixin
 
 
-class PetModel(db.Model):
+class PetModel(SoftDeleteMixin, db.Model):
     __tablename__ = "pets"
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(80), nullable=False)
     type = db.Column(db.String(20), nullable=False)
     age = db.Column(db.Integer, nullable=False)
-    owner_id = db.Column(db.Integer, db.ForeignKey("owners.id"), nullable=False)
+    owner_id = db.Column(db.Integer, db.ForeignKey("owners.id", ondelete="CASCADE"), nullable=False)
 
     # Relationship back to owner
     owner = db.relationship("OwnerModel", back_populates="pets")
@@ -22,5 +23,5 @@ class PetModel(db.Model):
     # Relationship: one pet can have many reservations
     reservations = db.relationship(
         "ReservationModel", back_populates="pet", cascade="all, delete",
-        lazy="dynamic"
+        lazy="dynamic", passive_deletes=True
     )
\ No newline at end of file
@@ -21,5 +21,5 @@ class ProviderModel(db.Model):
     # Relationship: one provider can offer many services
     services = db.relationship(
         "BoardingServiceModel", back_populates="provider", cascade="all, delete",
-        lazy="dynamic"
+        lazy="dynamic", passive_deletes=True
     )
\ No newline at end of file
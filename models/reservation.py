@@ -5,6 +5,7 @@ range.  A reservation belongs to one pet and one service.
 """
 
 from db import db
+from models.pet import PetModel
 
 
 class ReservationModel(db.Model):
@@ -14,9 +15,29 @@ class ReservationModel(db.Model):
     start_date = db.Column(db.Date, nullable=False)
     end_date = db.Column(db.Date, nullable=False)
 
-    pet_id = db.Column(db.Integer, db.ForeignKey("pets.id"), nullable=False)
-    service_id = db.Column(db.Integer, db.ForeignKey("services.id"), nullable=False)
+    pet_id = db.Column(
+        db.Integer, db.ForeignKey("pets.id", ondelete="CASCADE"),
+        nullable=False, index=True
+    )
+    service_id = db.Column(
+        db.Integer, db.ForeignKey("services.id", ondelete="CASCADE"),
+        nullable=False, index=True
+    )
 
     # Relationships back to pet and service
     pet = db.relationship("PetModel", back_populates="reservations")
-    service = db.relationship("BoardingServiceModel", back_populates="reservations")
\ No newline at end of file
+    service = db.relationship("BoardingServiceModel", back_populates="reservations")
+
+    @classmethod
+    def overlapping(cls, service_id, start_date, end_date):
+        """Query active reservations on a service overlapping the dates.
+
+        This is the occupancy used for every capacity check: the number
+        of these must stay below the service's capacity.
+        """
+        return cls.query.join(PetModel).filter(
+            PetModel.deleted_at.is_(None),
+            cls.service_id == service_id,
+            cls.start_date <= end_date,
+            cls.end_date >= start_date,
+        )
\ No newline at end of file
@@ -7,9 +7,10 @@ because not all services provide fixed pricing or capacity.
 """
 
 from db import db
+from models.soft_delete import SoftDeleteMixin
 
 
-class BoardingServiceModel(db.Model):
+class BoardingServiceModel(SoftDeleteMixin, db.Model):
     __tablename__ = "services"
 
     id = db.Column(db.Integer, primary_key=True)
@@ -20,12 +21,12 @@ class BoardingServiceModel(db.Model):
     type = db.Column(db.String(30), nullable=False)
 
     # Link to provider who owns this service
-    provider_id = db.Column(db.Integer, db.ForeignKey("providers.id"), nullable=False)
+    provider_id = db.Column(db.Integer, db.ForeignKey("providers.id", ondelete="CASCADE"), nullable=False)
 
     provider = db.relationship("ProviderModel", back_populates="services")
 
     # Relationship: one service can host many reservations
     reservations = db.relationship(
         "ReservationModel", back_populates="service", cascade="all, delete",
-        lazy="dynamic"
+        lazy="dynamic", passive_deletes=True
     )
\ No newline at end of file
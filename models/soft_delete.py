@@ -0,0 +1,34 @@
+"""Soft-delete support shared by deletable models.
+
+Deleting a service or pet only stamps `deleted_at` so the request
+returns immediately.  Hot queries go through `active()`, which
+filters on the indexed column, and the rows together with their
+reservations are purged later in bounded batches by the background
+worker (see `purge.py`).
+"""
+
+from datetime import datetime
+
+from db import db
+
+
+class SoftDeleteMixin:
+    deleted_at = db.Column(db.DateTime, nullable=True, index=True)
+
+    @property
+    def is_deleted(self):
+        return self.deleted_at is not None
+
+    @classmethod
+    def active(cls):
+        """Return a query restricted to rows that are not soft-deleted."""
+        return cls.query.filter(cls.deleted_at.is_(None))
+
+    @classmethod
+    def get_active_or_404(cls, ident):
+        """Like `query.get_or_404`, but soft-deleted rows are not found."""
+        return cls.active().filter(cls.id == ident).first_or_404()
+
+    def soft_delete(self):
+        """Flag this row as deleted.  The caller commits the session."""
+        self.deleted_at = datetime.utcnow()
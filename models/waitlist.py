@@ -0,0 +1,59 @@
+"""SQLAlchemy model for a waitlist entry.
+
+Owners join the waitlist when a service is fully booked for the dates
+they want.  Entries stay "waiting" until a cancellation or a capacity
+increase frees room, at which point the background worker turns them
+into reservations ("promoted") in the order they joined.  Owners can
+leave the waitlist ("cancelled"), and entries whose start date passes
+while waiting are marked "expired".
+"""
+
+from datetime import date, datetime
+
+from db import db
+from models.pet import PetModel
+
+
+class WaitlistEntryModel(db.Model):
+    __tablename__ = "waitlist_entries"
+    __table_args__ = (
+        db.Index(
+            "ix_waitlist_service_status_dates",
+            "service_id", "status", "start_date", "end_date",
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    start_date = db.Column(db.Date, nullable=False)
+    end_date = db.Column(db.Date, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="waiting")
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    pet_id = db.Column(
+        db.Integer, db.ForeignKey("pets.id", ondelete="CASCADE"),
+        nullable=False, index=True
+    )
+    service_id = db.Column(
+        db.Integer, db.ForeignKey("services.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    # Set once the entry has been promoted
+    reservation_id = db.Column(
+        db.Integer, db.ForeignKey("reservations.id", ondelete="SET NULL"),
+        nullable=True
+    )
+
+    pet = db.relationship("PetModel")
+    service = db.relationship("BoardingServiceModel")
+
+    @classmethod
+    def waiting_for(cls, service_id, start_date, end_date):
+        """Query live waiting entries on a service overlapping the dates."""
+        return cls.query.join(PetModel).filter(
+            PetModel.deleted_at.is_(None),
+            cls.service_id == service_id,
+            cls.status == "waiting",
+            cls.start_date >= date.today(),
+            cls.start_date <= end_date,
+            cls.end_date >= start_date,
+        )
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""Waitlist promotion.
+
+When a reservation is cancelled, a pet holding reservations is deleted,
+an owner joins the waitlist while capacity is free or a service's
+capacity grows, the request calls `enqueue_promotion` and the worker
+later runs `promote_waitlist` (see `tasks.py`).  Freed capacity only
+helps waiters whose dates overlap it, so the freed range travels with
+the job and limits the scan; a pending job for the same service is
+widened rather than duplicated.  Capacity increases carry no range and
+rescan every waiter.  The service's reservations across the scanned
+waiters' dates are loaded once, as plain date pairs, and waiters that
+clearly cannot fit are skipped in memory.  Each remaining waiter is
+claimed with a conditional UPDATE and the occupancy is re-counted inside
+that claiming transaction, so concurrent promotions, direct bookings and
+owners leaving the waitlist can never double-book an entry or overbook
+the service.  The capacity rule is the same as in
+`ReservationsList.post`.
+"""
+
+from datetime import date
+
+from db import db
+from jobs import enqueue
+from models.job import JobModel
+from models.pet import PetModel
+from models.reservation import ReservationModel
+from models.service import BoardingServiceModel
+from models.waitlist import WaitlistEntryModel
+
+
+def _overlapping(occupancy, start_date, end_date):
+    return sum(
+        1 for booked_start, booked_end in occupancy
+        if booked_start <= end_date and booked_end >= start_date
+    )
+
+
+def expire_waitlist(service_id):
+    """Mark waiting entries whose start date has passed as expired."""
+    count = WaitlistEntryModel.query.filter(
+        WaitlistEntryModel.service_id == service_id,
+        WaitlistEntryModel.status == "waiting",
+        WaitlistEntryModel.start_date < date.today(),
+    ).update({"status": "expired"}, synchronize_session=False)
+    db.session.commit()
+    return count
+
+
+def _promote(entry_id, pet_id, service_id, start_date, end_date, capacity):
+    """Claim one waiting entry and book it if there is still room.
+
+    Returns True when the entry was promoted.
+    """
+    claimed = WaitlistEntryModel.query.filter_by(
+        id=entry_id, status="waiting"
+    ).update({"status": "promoted"}, synchronize_session=False)
+    if not claimed:
+        # Promoted by another worker or left by the owner meanwhile
+        db.session.rollback()
+        return False
+
+    if ReservationModel.overlapping(service_id, start_date, end_date).count() >= capacity:
+        db.session.rollback()
+        return False
+
+    reservation = ReservationModel(
+        start_date=start_date,
+        end_date=end_date,
+        pet_id=pet_id,
+        service_id=service_id,
+    )
+    db.session.add(reservation)
+    db.session.flush()
+    WaitlistEntryModel.query.filter_by(id=entry_id).update(
+        {"reservation_id": reservation.id}, synchronize_session=False
+    )
+    db.session.commit()
+    return True
+
+
+def _merge_ranges(payload, other):
+    """Return a payload covering the freed ranges of both payloads."""
+    if "start_date" not in payload or "start_date" not in other:
+        return {"service_id": payload["service_id"]}
+    return {
+        "service_id": payload["service_id"],
+        "start_date": min(payload["start_date"], other["start_date"]),
+        "end_date": max(payload["end_date"], other["end_date"]),
+    }
+
+
+def enqueue_promotion(service_id, start_date=None, end_date=None):
+    """Add a promotion job for `service_id` to the current session.
+
+    `start_date`/`end_date` give the range where capacity was freed;
+    omit them to rescan every waiter.  When a promotion for the service
+    is already pending, its range is widened instead, with a conditional
+    UPDATE so a job a worker has just claimed is never changed.
+    """
+    payload = {"service_id": service_id}
+    if start_date is not None and end_date is not None:
+        payload["start_date"] = start_date.isoformat()
+        payload["end_date"] = end_date.isoformat()
+
+    for job in JobModel.query.filter_by(task="promote_waitlist", status="pending"):
+        if job.payload.get("service_id") != service_id:
+            continue
+        merged = _merge_ranges(job.payload, payload)
+        if merged == job.payload:
+            return job
+        widened = JobModel.query.filter_by(id=job.id, status="pending").update(
+            {"payload": merged}, synchronize_session=False
+        )
+        if widened:
+            return job
+        break
+    return enqueue("promote_waitlist", payload)
+
+
+def promote_waitlist(service_id, start_date=None, end_date=None):
+    """Turn waiting entries into reservations while capacity allows.
+
+    With `start_date`/`end_date` (ISO strings or dates) only entries
+    overlapping that freed range are considered.  Entries are taken in
+    the order they joined.  Must be called inside an application
+    context.  Returns the number of entries promoted.
+    """
+    service = BoardingServiceModel.active().filter_by(id=service_id).first()
+    if service is None or service.capacity is None:
+        return 0
+    capacity = service.capacity
+
+    expire_waitlist(service_id)
+    candidates = (
+        db.session.query(
+            WaitlistEntryModel.id,
+            WaitlistEntryModel.pet_id,
+            WaitlistEntryModel.start_date,
+            WaitlistEntryModel.end_date,
+        )
+        .join(PetModel)
+        .filter(
+            PetModel.deleted_at.is_(None),
+            WaitlistEntryModel.service_id == service_id,
+            WaitlistEntryModel.status == "waiting",
+        )
+    )
+    if start_date is not None and end_date is not None:
+        if isinstance(start_date, str):
+            start_date = date.fromisoformat(start_date)
+        if isinstance(end_date, str):
+            end_date = date.fromisoformat(end_date)
+        candidates = candidates.filter(
+            WaitlistEntryModel.start_date <= end_date,
+            WaitlistEntryModel.end_date >= start_date,
+        )
+    candidates = candidates.order_by(WaitlistEntryModel.id).all()
+    if not candidates:
+        return 0
+
+    span_start = min(entry.start_date for entry in candidates)
+    span_end = max(entry.end_date for entry in candidates)
+    occupancy = (
+        ReservationModel.overlapping(service_id, span_start, span_end)
+        .with_entities(ReservationModel.start_date, ReservationModel.end_date)
+        .all()
+    )
+
+    promoted = 0
+    for entry in candidates:
+        if _overlapping(occupancy, entry.start_date, entry.end_date) >= capacity:
+            continue
+        if _promote(entry.id, entry.pet_id, service_id,
+                    entry.start_date, entry.end_date, capacity):
+            occupancy.append((entry.start_date, entry.end_date))
+            promoted += 1
+    return promoted
@@ -0,0 +1,99 @@
+"""Background purge of soft-deleted services and pets.
+
+Deleting a service or pet through the API only flags the row (see
+`models/soft_delete.py`).  This module removes the flagged rows
+and their reservations afterwards, outside of any request.  Children
+are deleted with bulk DELETE statements in bounded batches, committing
+after each batch, so a service with years of reservations never holds
+a long transaction or loads its reservations into memory.
+
+Deletes enqueue a "purge_deleted" job for the background worker (see
+`tasks.py`); the module can also be run directly as a one-off:
+
+    python purge.py
+"""
+
+import time
+
+from sqlalchemy import or_, select
+
+from db import db
+from models.pet import PetModel
+from models.reservation import ReservationModel
+from models.service import BoardingServiceModel
+from models.waitlist import WaitlistEntryModel
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def _delete_in_batches(model, criterion, batch_size, on_batch=None):
+    """Delete rows of `model` matching `criterion`, `batch_size` at a time.
+
+    `on_batch` is called before each batch is committed.  Returns the
+    total number of rows deleted.
+    """
+    total = 0
+    while True:
+        ids = [
+            row.id for row in
+            db.session.query(model.id).filter(criterion).limit(batch_size)
+        ]
+        if not ids:
+            return total
+        model.query.filter(model.id.in_(ids)).delete(synchronize_session=False)
+        if on_batch is not None:
+            on_batch()
+        db.session.commit()
+        total += len(ids)
+
+
+def purge_deleted(batch_size=DEFAULT_BATCH_SIZE, on_batch=None):
+    """Permanently remove soft-deleted rows and everything hanging off them.
+
+    Waitlist entries and reservations go first, then pets and services.
+    Must be called inside an application context.  `on_batch` is called before every batch
+    commit, e.g. to heartbeat the running job.  Returns a dict with the
+    number of rows removed per table.
+    """
+    deleted_services = select(BoardingServiceModel.id).where(
+        BoardingServiceModel.deleted_at.isnot(None)
+    )
+    deleted_pets = select(PetModel.id).where(PetModel.deleted_at.isnot(None))
+
+    counts = {}
+    counts["waitlist_entries"] = _delete_in_batches(
+        WaitlistEntryModel,
+        or_(
+            WaitlistEntryModel.service_id.in_(deleted_services),
+            WaitlistEntryModel.pet_id.in_(deleted_pets),
+        ),
+        batch_size, on_batch,
+    )
+    counts["reservations"] = _delete_in_batches(
+        ReservationModel,
+        or_(
+            ReservationModel.service_id.in_(deleted_services),
+            ReservationModel.pet_id.in_(deleted_pets),
+        ),
+        batch_size, on_batch,
+    )
+    counts["pets"] = _delete_in_batches(
+        PetModel, PetModel.deleted_at.isnot(None), batch_size, on_batch
+    )
+    counts["services"] = _delete_in_batches(
+        BoardingServiceModel, BoardingServiceModel.deleted_at.isnot(None),
+        batch_size, on_batch,
+    )
+    return counts
+
+
+if __name__ == "__main__":
+    from app import create_app
+
+    app = create_app()
+    with app.app_context():
+        started = time.perf_counter()
+        counts = purge_deleted()
+        elapsed = time.perf_counter() - started
+        print(f"Purged {counts} in {elapsed:.2f}s")
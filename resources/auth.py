@@ -6,7 +6,6 @@ stored.  Upon successful login, a JWT access token is returned with
 the user's ID and role encoded in the identity.
 """
 
-from flask import request
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
 from flask_jwt_extended import create_access_token
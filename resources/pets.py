@@ -5,14 +5,19 @@ blueprint require an authenticated owner.  Pets belong exclusively to
 their owner and cannot be managed by other owners or providers.
 """
 
-from flask import request
+from datetime import date
+
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import func
 
 from db import db
+from jobs import enqueue
 from models.pet import PetModel
 from models.owner import OwnerModel
+from models.reservation import ReservationModel
+from promotion import enqueue_promotion
 from schemas.pet import PetSchema
 
 blp = Blueprint(
@@ -34,7 +39,7 @@ class PetsList(MethodView):
 
         owner_id = identity["id"]
         owner = OwnerModel.query.get_or_404(owner_id)
-        return owner.pets.all()
+        return owner.pets.filter_by(deleted_at=None).all()
 
     @jwt_required()
     @blp.arguments(PetSchema)
@@ -67,10 +72,24 @@ class PetResource(MethodView):
         if identity.get("role") != "owner":
             abort(403, message="Only owners can delete pets.")
 
-        pet = PetModel.query.get_or_404(pet_id)
+        pet = PetModel.get_active_or_404(pet_id)
         if pet.owner_id != identity["id"]:
             abort(403, message="You do not have permission to delete this pet.")
 
-        db.session.delete(pet)
+        # Flag only; the worker purges the row and its reservations
+        pet.soft_delete()
+        enqueue("purge_deleted", unique=True)
+        # The pet's upcoming reservations no longer count, so offer their
+        # capacity to the waitlist
+        upcoming = db.session.query(
+            ReservationModel.service_id,
+            func.min(ReservationModel.start_date),
+            func.max(ReservationModel.end_date),
+        ).filter(
+            ReservationModel.pet_id == pet.id,
+            ReservationModel.end_date >= date.today(),
+        ).group_by(ReservationModel.service_id)
+        for service_id, start_date, end_date in upcoming:
+            enqueue_promotion(service_id, start_date, end_date)
         db.session.commit()
         return {"message": "Pet deleted."}
\ No newline at end of file
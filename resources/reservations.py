@@ -7,9 +7,6 @@ reservation.  Providers can list reservations by service using the
 services blueprint.
 """
 
-from datetime import datetime
-
-from flask import request
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
@@ -19,6 +16,8 @@ from models.reservation import ReservationModel
 from models.pet import PetModel
 from models.service import BoardingServiceModel
 from models.owner import OwnerModel
+from models.waitlist import WaitlistEntryModel
+from promotion import enqueue_promotion
 from schemas.reservation import ReservationSchema
 
 
@@ -39,11 +38,19 @@ class ReservationsList(MethodView):
             abort(403, message="Only owners can view their reservations.")
 
         owner = OwnerModel.query.get_or_404(identity["id"])
-        # Gather reservations across all owner's pets
-        reservations = []
-        for pet in owner.pets:
-            reservations.extend(pet.reservations.all())
-        return reservations
+        # Gather reservations across all of the owner's active pets and
+        # services in a single query
+        return (
+            ReservationModel.query
+            .join(PetModel)
+            .join(BoardingServiceModel)
+            .filter(
+                PetModel.owner_id == owner.id,
+                PetModel.deleted_at.is_(None),
+                BoardingServiceModel.deleted_at.is_(None),
+            )
+            .all()
+        )
 
     @jwt_required()
     @blp.arguments(ReservationSchema)
@@ -54,26 +61,37 @@ class ReservationsList(MethodView):
             abort(403, message="Only owners can create reservations.")
 
         # Validate pet ownership
-        pet = PetModel.query.get_or_404(reservation_data["pet_id"])
+        pet = PetModel.get_active_or_404(reservation_data["pet_id"])
         if pet.owner_id != identity["id"]:
             abort(403, message="You can only reserve services for your own pets.")
 
         # Validate service existence
-        service = BoardingServiceModel.query.get_or_404(reservation_data["service_id"])
+        service = BoardingServiceModel.get_active_or_404(reservation_data["service_id"])
 
         # Parse and validate dates
         if reservation_data["start_date"] > reservation_data["end_date"]:
             abort(400, message="start_date must be on or before end_date.")
 
-        # Optional: enforce capacity constraints
+        # Optional: enforce capacity constraints.  Freed capacity goes to
+        # the waitlist first, so nobody can book past owners already waiting.
         if service.capacity is not None:
-            overlapping = ReservationModel.query.filter(
-                ReservationModel.service_id == service.id,
-                ReservationModel.start_date <= reservation_data["end_date"],
-                ReservationModel.end_date >= reservation_data["start_date"],
+            overlapping = ReservationModel.overlapping(
+                service.id, reservation_data["start_date"], reservation_data["end_date"]
             ).count()
             if overlapping >= service.capacity:
-                abort(409, message="Service is fully booked for the selected dates.")
+                abort(
+                    409,
+                    message="Service is fully booked for the selected dates. "
+                            "Join the waitlist with POST /waitlist.",
+                )
+            if WaitlistEntryModel.waiting_for(
+                service.id, reservation_data["start_date"], reservation_data["end_date"]
+            ).first():
+                abort(
+                    409,
+                    message="Other owners are waiting for these dates. "
+                            "Join the waitlist with POST /waitlist.",
+                )
 
         reservation = ReservationModel(
             start_date=reservation_data["start_date"],
@@ -102,6 +120,10 @@ class ReservationResource(MethodView):
         if pet.owner_id != identity["id"]:
             abort(403, message="You do not have permission to cancel this reservation.")
 
+        # Offer the freed capacity to the waitlist in the same transaction
+        enqueue_promotion(
+            reservation.service_id, reservation.start_date, reservation.end_date
+        )
         db.session.delete(reservation)
         db.session.commit()
         return {"message": "Reservation cancelled."}
\ No newline at end of file
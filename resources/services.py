@@ -14,9 +14,12 @@ from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from db import db
+from jobs import enqueue
+from models.pet import PetModel
 from models.service import BoardingServiceModel
-from models.provider import ProviderModel
 from models.reservation import ReservationModel
+from models.waitlist import WaitlistEntryModel
+from promotion import enqueue_promotion
 from schemas.service import BoardingServiceSchema
 from schemas.reservation import ReservationSchema
 
@@ -60,7 +63,7 @@ class ServiceList(MethodView):
 
     @blp.response(200, BoardingServiceSchema(many=True))
     def get(self):
-        services = BoardingServiceModel.query.all()
+        services = BoardingServiceModel.active().all()
 
         result = []
         for s in services:
@@ -86,7 +89,7 @@ class ServiceResource(MethodView):
 
     @blp.response(200, BoardingServiceSchema)
     def get(self, service_id):
-        service = BoardingServiceModel.query.get_or_404(service_id)
+        service = BoardingServiceModel.get_active_or_404(service_id)
         return service
 
     @jwt_required()
@@ -97,15 +100,20 @@ class ServiceResource(MethodView):
         if identity.get("role") != "provider":
             abort(403, message="Only providers can update services.")
 
-        service = BoardingServiceModel.query.get_or_404(service_id)
+        service = BoardingServiceModel.get_active_or_404(service_id)
         if service.provider_id != identity["id"]:
             abort(403, message="You can only update your own services.")
 
+        old_capacity = service.capacity
         service.name = service_data["name"]
         service.location = service_data["location"]
         service.price_per_day = service_data.get("price_per_day")
         service.capacity = service_data.get("capacity")
         service.type = service_data["type"]
+        if service.capacity is not None and (
+            old_capacity is None or service.capacity > old_capacity
+        ):
+            enqueue_promotion(service.id)
         db.session.commit()
         return service
 
@@ -115,11 +123,13 @@ class ServiceResource(MethodView):
         if identity.get("role") != "provider":
             abort(403, message="Only providers can delete services.")
 
-        service = BoardingServiceModel.query.get_or_404(service_id)
+        service = BoardingServiceModel.get_active_or_404(service_id)
         if service.provider_id != identity["id"]:
             abort(403, message="You can only delete your own services.")
 
-        db.session.delete(service)
+        # Flag only; the worker purges the row and its reservations
+        service.soft_delete()
+        enqueue("purge_deleted", unique=True)
         db.session.commit()
         return {"message": "Service deleted."}
 
@@ -135,11 +145,13 @@ class ServiceReservations(MethodView):
         if identity.get("role") != "provider":
             abort(403, message="Only providers can view reservations for their services.")
 
-        service = BoardingServiceModel.query.get_or_404(service_id)
+        service = BoardingServiceModel.get_active_or_404(service_id)
         if service.provider_id != identity["id"]:
             abort(403, message="You can only view reservations for your own services.")
 
-        return service.reservations.all()
+        return service.reservations.join(PetModel).filter(
+            PetModel.deleted_at.is_(None)
+        ).all()
 
 
 @blp.route("/services/<int:service_id>/availability")
@@ -148,7 +160,7 @@ class ServiceAvailability(MethodView):
 
     @blp.response(200)
     def get(self, service_id):
-        service = BoardingServiceModel.query.get_or_404(service_id)
+        service = BoardingServiceModel.get_active_or_404(service_id)
         if service.capacity is None:
             return {
                 "available": False,
@@ -168,10 +180,13 @@ class ServiceAvailability(MethodView):
             abort(400, message="Invalid date format. Use YYYY-MM-DD.")
 
         # Count existing reservations overlapping the requested range
-        overlapping_reservations = ReservationModel.query.filter(
-            ReservationModel.service_id == service_id,
-            ReservationModel.start_date <= end_date,
-            ReservationModel.end_date >= start_date,
+        overlapping_reservations = ReservationModel.overlapping(
+            service_id, start_date, end_date
+        ).count()
+        # Freed capacity is held for the waitlist, so none is bookable
+        # while anyone is waiting for these dates
+        waitlisted = WaitlistEntryModel.waiting_for(
+            service_id, start_date, end_date
         ).count()
 
         available_count = service.capacity - overlapping_reservations
@@ -179,5 +194,6 @@ class ServiceAvailability(MethodView):
             "service_id": service_id,
             "capacity": service.capacity,
             "reserved": overlapping_reservations,
-            "available": max(available_count, 0),
+            "waitlisted": waitlisted,
+            "available": max(available_count, 0) if not waitlisted else 0,
         }
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""Waitlist blueprint.
+
+Owners whose booking was rejected because a service is fully booked can
+join the waitlist for the same pet, service and dates.  The background
+worker promotes waiting entries into reservations when capacity frees
+up.  Instead of polling availability, clients long-poll a single entry
+with `GET /waitlist/<id>?wait=<seconds>`, which returns as soon as the
+entry leaves the "waiting" state or the wait runs out.
+"""
+
+import time
+from datetime import date
+
+from flask import request
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from db import db
+from models.pet import PetModel
+from models.reservation import ReservationModel
+from models.service import BoardingServiceModel
+from models.waitlist import WaitlistEntryModel
+from promotion import enqueue_promotion
+from schemas.waitlist import WaitlistEntrySchema
+
+
+blp = Blueprint(
+    "Waitlist", __name__, description="Waitlist for fully booked services (owner-only)"
+)
+
+# Upper bound and re-check interval for long-polling a waitlist entry
+MAX_WAIT_SECONDS = 30
+POLL_INTERVAL_SECONDS = 1
+
+
+def _get_own_entry(entry_id, identity):
+    entry = WaitlistEntryModel.query.get_or_404(entry_id)
+    pet = PetModel.query.get(entry.pet_id)
+    if pet.owner_id != identity["id"]:
+        abort(403, message="You do not have permission to access this waitlist entry.")
+    return entry
+
+
+@blp.route("/waitlist")
+class WaitlistList(MethodView):
+    """Join the waitlist and list the current owner's entries."""
+
+    @jwt_required()
+    @blp.response(200, WaitlistEntrySchema(many=True))
+    def get(self):
+        identity = get_jwt_identity()
+        if identity.get("role") != "owner":
+            abort(403, message="Only owners can view their waitlist entries.")
+
+        return (
+            WaitlistEntryModel.query
+            .join(PetModel)
+            .filter(PetModel.owner_id == identity["id"], PetModel.deleted_at.is_(None))
+            .order_by(WaitlistEntryModel.id)
+            .all()
+        )
+
+    @jwt_required()
+    @blp.arguments(WaitlistEntrySchema)
+    @blp.response(201, WaitlistEntrySchema)
+    def post(self, entry_data):
+        identity = get_jwt_identity()
+        if identity.get("role") != "owner":
+            abort(403, message="Only owners can join the waitlist.")
+
+        pet = PetModel.get_active_or_404(entry_data["pet_id"])
+        if pet.owner_id != identity["id"]:
+            abort(403, message="You can only join the waitlist with your own pets.")
+
+        service = BoardingServiceModel.get_active_or_404(entry_data["service_id"])
+        if service.capacity is None:
+            abort(400, message="Capacity information not provided for this service.")
+
+        if entry_data["start_date"] > entry_data["end_date"]:
+            abort(400, message="start_date must be on or before end_date.")
+
+        if entry_data["start_date"] < date.today():
+            abort(400, message="start_date must not be in the past.")
+
+        overlapping = ReservationModel.overlapping(
+            service.id, entry_data["start_date"], entry_data["end_date"]
+        ).count()
+        if overlapping < service.capacity and not WaitlistEntryModel.waiting_for(
+            service.id, entry_data["start_date"], entry_data["end_date"]
+        ).first():
+            abort(409, message="Service has capacity for the selected dates; book it directly.")
+
+        if WaitlistEntryModel.query.filter_by(
+            pet_id=pet.id,
+            service_id=service.id,
+            start_date=entry_data["start_date"],
+            end_date=entry_data["end_date"],
+            status="waiting",
+        ).first():
+            abort(409, message="This pet is already on the waitlist for these dates.")
+
+        entry = WaitlistEntryModel(
+            start_date=entry_data["start_date"],
+            end_date=entry_data["end_date"],
+            pet_id=pet.id,
+            service_id=service.id,
+        )
+        db.session.add(entry)
+        if overlapping < service.capacity:
+            # Free room held back for earlier waiters who may not fit it;
+            # let the worker decide, in order, who gets it
+            enqueue_promotion(service.id, entry.start_date, entry.end_date)
+        db.session.commit()
+        return entry
+
+
+@blp.route("/waitlist/<int:entry_id>")
+class WaitlistResource(MethodView):
+    """Check or leave a specific waitlist entry (owner-only)."""
+
+    @jwt_required()
+    @blp.response(200, WaitlistEntrySchema)
+    def get(self, entry_id):
+        identity = get_jwt_identity()
+        if identity.get("role") != "owner":
+            abort(403, message="Only owners can view their waitlist entries.")
+
+        entry = _get_own_entry(entry_id, identity)
+        if entry.status == "waiting" and entry.start_date < date.today():
+            entry.status = "expired"
+            db.session.commit()
+
+        try:
+            wait = min(float(request.args.get("wait", 0)), MAX_WAIT_SECONDS)
+        except ValueError:
+            abort(400, message="wait must be a number of seconds")
+
+        # Long-poll: re-read only this row until it changes or time is up
+        deadline = time.monotonic() + wait
+        while entry.status == "waiting" and time.monotonic() < deadline:
+            db.session.rollback()
+            time.sleep(POLL_INTERVAL_SECONDS)
+            entry = WaitlistEntryModel.query.get_or_404(entry_id)
+        return entry
+
+    @jwt_required()
+    def delete(self, entry_id):
+        identity = get_jwt_identity()
+        if identity.get("role") != "owner":
+            abort(403, message="Only owners can leave the waitlist.")
+
+        _get_own_entry(entry_id, identity)
+        # Conditional so a concurrent promotion is never overwritten
+        cancelled = WaitlistEntryModel.query.filter_by(
+            id=entry_id, status="waiting"
+        ).update({"status": "cancelled"}, synchronize_session=False)
+        db.session.commit()
+        if not cancelled:
+            abort(409, message="Only waiting entries can be cancelled.")
+        return {"message": "Left the waitlist."}
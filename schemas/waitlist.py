@@ -0,0 +1,24 @@
+"""Marshmallow schema for waitlist entry serialization and deserialization.
+
+Clients supply the pet, service and dates they want; the status and
+the resulting reservation are managed by the server.
+"""
+
+from marshmallow import Schema, fields
+
+
+class WaitlistEntrySchema(Schema):
+    id = fields.Int(dump_only=True)
+    start_date = fields.Date(required=True, metadata={"description": "Start date of the stay"})
+    end_date = fields.Date(required=True, metadata={"description": "End date of the stay"})
+    pet_id = fields.Int(required=True)
+    service_id = fields.Int(required=True)
+    status = fields.Str(
+        dump_only=True,
+        metadata={"description": "One of waiting, promoted, cancelled or expired"},
+    )
+    reservation_id = fields.Int(
+        dump_only=True, allow_none=True,
+        metadata={"description": "Reservation created when the entry was promoted"},
+    )
+    created_at = fields.DateTime(dump_only=True)
@@ -0,0 +1,29 @@
+"""Task handlers executed by the background worker.
+
+Each handler is registered under the name that request handlers pass
+to `jobs.enqueue`.  Handlers run inside an application context and
+must be safe to retry, since a job is attempted again after a failure.
+"""
+
+from flask import current_app
+
+from jobs import heartbeat, task
+from promotion import promote_waitlist
+from purge import purge_deleted
+
+
+@task("purge_deleted")
+def purge_deleted_rows():
+    """Remove soft-deleted rows and their reservations in batches."""
+    counts = purge_deleted(on_batch=heartbeat)
+    current_app.logger.info("Purged soft-deleted rows: %s", counts)
+
+
+@task("promote_waitlist")
+def promote_waitlist_entries(service_id, start_date=None, end_date=None):
+    """Book waiting entries into capacity freed on a service."""
+    promoted = promote_waitlist(service_id, start_date, end_date)
+    if promoted:
+        current_app.logger.info(
+            "Promoted %s waitlist entries for service %s", promoted, service_id
+        )
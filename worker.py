@@ -0,0 +1,74 @@
+"""Background worker entrypoint.
+
+Starts a pool of worker processes that each build the Flask app and
+drain the `jobs` table:
+
+    python worker.py --processes 4
+
+Each process polls for due jobs, runs them one at a time and sleeps for
+`--poll-interval` seconds whenever the queue is empty.  Requeuing stale
+jobs and pruning finished ones are writes, so they run only every
+MAINTENANCE_INTERVAL seconds rather than on every poll.  Errors outside
+a job (e.g. "database is locked") are logged and the loop carries on;
+a process that dies anyway is restarted by the parent.
+"""
+
+import argparse
+import multiprocessing
+import time
+
+
+# Seconds between stale-job/pruning passes; well under jobs.STALE_AFTER
+MAINTENANCE_INTERVAL = 60
+
+
+def work(poll_interval):
+    """Run jobs forever in the current process."""
+    from app import create_app
+    from db import db
+    import jobs
+    import tasks  # noqa: F401  (registers task handlers)
+
+    app = create_app()
+    next_maintenance = time.monotonic()
+    with app.app_context():
+        while True:
+            try:
+                if time.monotonic() >= next_maintenance:
+                    next_maintenance = time.monotonic() + MAINTENANCE_INTERVAL
+                    jobs.requeue_stale()
+                    jobs.prune_done()
+                while jobs.run_next():
+                    pass
+            except Exception:
+                app.logger.exception("Worker loop failed; retrying")
+                db.session.rollback()
+            time.sleep(poll_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background job workers.")
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    def spawn():
+        process = multiprocessing.Process(target=work, args=(args.poll_interval,))
+        process.start()
+        return process
+
+    processes = [spawn() for _ in range(args.processes)]
+    try:
+        while True:
+            time.sleep(args.poll_interval)
+            processes = [
+                process if process.is_alive() else spawn()
+                for process in processes
+            ]
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()